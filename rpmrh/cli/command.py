@@ -1,21 +1,19 @@
 """Command Line Interface for the package"""
 import logging
+from bisect import insort
 from collections import defaultdict
 from collections import OrderedDict
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
 from functools import lru_cache
-from functools import reduce
 from itertools import chain
 from itertools import product
-from operator import attrgetter
 from pathlib import Path
 from typing import Iterator
 
 import attr
 import click
-from ruamel import yaml
 
 from .. import configuration
 from .. import RESOURCE_ID
@@ -28,6 +26,7 @@ from ..service.jenkins import UnknownJob
 from .tooling import Package
 from .tooling import PackageStream
 from .tooling import SCL
+from .tooling import dump_yaml
 from .tooling import stream_generator
 from .tooling import stream_processor
 
@@ -136,6 +135,11 @@ def main(context, source, destination, **_options):
         context.obj["destination"] = extract_services(destination)
         log.debug("destination:", destination)
 
+    # All configuration is validated by this point; the attrs run-time
+    # validators would only re-check known-good data on every package
+    # flowing through the pipeline.
+    attr.set_run_validators(False)
+
 
 @main.resultcallback()
 @click.pass_context
@@ -190,7 +194,9 @@ def run_chain(
         package_stream = PackageStream(Package(scl=scl) for scl in collections)
 
     # Apply the processors
-    pipeline = reduce(lambda data, proc: proc(data), processor_seq, package_stream)
+    pipeline = package_stream
+    for processor in processor_seq:
+        pipeline = processor(pipeline)
 
     # Output the results in YAML format
     PackageStream.consume(pipeline).to_yaml(stream=report)
@@ -214,10 +220,26 @@ def diff(package_stream, min_days, simple_dist):
 
     log = logger.getChild("diff")
 
+    # Cache of per-tag queries — the tag contents do not change within
+    # a single run, so repeated queries are pure wasted round-trips.
+    # The service objects are not hashable;
+    # an explicit mapping stands in for functools.lru_cache here.
+    fetched_builds = {}
+
+    def tagged_builds(group, tag, package_prefix=None):
+        key = id(group["service"]), tag, package_prefix
+        try:
+            return fetched_builds[key]
+        except KeyError:
+            builds = tuple(
+                group["service"].latest_builds(tag, package_prefix=package_prefix)
+            )
+            return fetched_builds.setdefault(key, builds)
+
     # Filter implementations
-    def latest_builds(group):
+    def latest_builds(group, package_prefix=None):
         builds = chain.from_iterable(
-            group["service"].latest_builds(tag) for tag in group["tags"]
+            tagged_builds(group, tag, package_prefix) for tag in group["tags"]
         )
 
         if simple_dist:
@@ -225,8 +247,24 @@ def diff(package_stream, min_days, simple_dist):
         else:
             return builds
 
+    # Name → build mapping of a group's content,
+    # shared by all collections that resolve to the same tags.
+    present_cache = {}
+
+    def present_builds(group, package_prefix=None):
+        key = tuple((id(group["service"]), tag) for tag in group["tags"])
+        key += (package_prefix,)
+        try:
+            return present_cache[key]
+        except KeyError:
+            mapping = {
+                build.name: build for build in latest_builds(group, package_prefix)
+            }
+            return present_cache.setdefault(key, mapping)
+
     def obsolete(package, target_map):
-        return package.name in target_map and target_map[package.name] >= package
+        candidate = target_map.get(package.name)
+        return candidate is not None and candidate >= package
 
     def old_enough(package, source_map):
         # Skip this check if not explicitly requested
@@ -258,17 +296,13 @@ def diff(package_stream, min_days, simple_dist):
     # SCL processing
     for pkg in package_stream:
         try:
-            destination_builds = latest_builds(pkg.destination)
-            source_builds = latest_builds(pkg.source)
+            # Packages present in destination; queries are cached per
+            # (tags, collection prefix), so only the first collection
+            # hitting a given combination pays the remote round-trip.
+            present = present_builds(pkg.destination, pkg.scl.collection)
+            source_builds = latest_builds(pkg.source, pkg.scl.collection)
 
-            log.info("Comparing {s.collection}-el{s.el}".format(s=pkg.scl))
-
-            # Packages present in destination
-            present = {
-                build.name: build
-                for build in destination_builds
-                if has_collection_prefix(build, pkg.scl.collection)
-            }
+            log.info("Comparing {}-el{}".format(pkg.scl.collection, pkg.scl.el))
 
             missing = {
                 build
@@ -279,7 +313,7 @@ def diff(package_stream, min_days, simple_dist):
 
             ready = filter(lambda build: old_enough(build, pkg.source), missing)
 
-            yield from (attr.evolve(pkg, metadata=package) for package in ready)
+            yield from map(pkg.with_metadata, ready)
 
         except Exception as err:
             log.error(err)
@@ -299,16 +333,28 @@ def download(package_stream, output_dir):
     """Download packages into specified directory."""
 
     log = logger.getChild("download")
-    output_dir = Path(output_dir).resolve()
+    output_dir = Path(output_dir)
 
-    for pkg in package_stream:
-        collection_dir = output_dir / pkg.scl.collection
-        collection_dir.mkdir(exist_ok=True)
+    # Paths are resolved and directories created lazily —
+    # empty streams should not touch the file system at all,
+    # and each collection needs its mkdir only once.
+    prepared_dirs = {}
 
+    def collection_dir(collection: str) -> Path:
+        try:
+            return prepared_dirs[collection]
+        except KeyError:
+            target = output_dir.resolve() / collection
+            target.mkdir(exist_ok=True)
+            return prepared_dirs.setdefault(collection, target)
+
+    for pkg in package_stream:
         log.info("Fetching {}".format(pkg.metadata))
-        local = pkg.source["service"].download(pkg.metadata, collection_dir)
+        local = pkg.source["service"].download(
+            pkg.metadata, collection_dir(pkg.scl.collection)
+        )
 
-        yield attr.evolve(pkg, metadata=local)
+        yield pkg.with_metadata(local)
 
 
 @main.command()
@@ -323,7 +369,9 @@ def download(package_stream, output_dir):
 def build(package_stream, fail_file):
     """Attempt to build packages in target."""
 
-    failed = defaultdict(lambda: defaultdict(set))
+    # Failures are kept sorted as they are inserted (attrs orders them
+    # by package, then reason), so the report needs no final sort pass.
+    failed = defaultdict(lambda: defaultdict(list))
 
     for pkg in package_stream:
         with pkg.destination["service"] as builder:
@@ -331,9 +379,9 @@ def build(package_stream, fail_file):
             for target in pkg.destination["targets"]:
                 try:
                     built = builder.build(target, pkg.metadata)
-                    yield attr.evolve(pkg, metadata=built)
+                    yield pkg.with_metadata(built)
                 except BuildFailure as failure:
-                    failed[pkg.scl.collection][target].add(failure)
+                    insort(failed[pkg.scl.collection][target], failure)
 
     if not failed:
         return
@@ -341,10 +389,7 @@ def build(package_stream, fail_file):
     # Convert the stored exceptions to readable representation
     readable_failures = {
         scl: {
-            target: OrderedDict(
-                (f.package.nevra, f.reason)
-                for f in sorted(fails, key=attrgetter("package"))
-            )
+            target: OrderedDict((f.package.nevra, f.reason) for f in fails)
             for target, fails in targets.items()
         }
         for scl, targets in failed.items()
@@ -353,7 +398,7 @@ def build(package_stream, fail_file):
     if fail_file is None:
         fail_file = click.get_text_stream("stderr", encoding="utf-8")
 
-    yaml.dump(readable_failures, stream=fail_file, default_flow_style=False)
+    dump_yaml(readable_failures, fail_file)
 
 
 @main.command()
@@ -369,7 +414,7 @@ def tag(package_stream, owner):
             # TODO: Potentialy duplicates packages (one per tag!)
             for tag in pkg.destination["tags"]:
                 tagged = repo.tag_build(tag, pkg.metadata, owner=owner)
-                yield attr.evolve(pkg, metadata=tagged)
+                yield pkg.with_metadata(tagged)
 
 
 @main.command()
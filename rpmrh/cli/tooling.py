@@ -1,9 +1,9 @@
 """Additional CLI-specific tooling"""
 
 import logging
-from collections import defaultdict
-from copy import deepcopy
-from functools import partial, wraps
+from collections import defaultdict, OrderedDict
+from functools import lru_cache, partial, wraps
+from io import StringIO
 from itertools import groupby
 from operator import attrgetter, itemgetter
 from typing import Iterator, Optional, Union
@@ -11,17 +11,85 @@ from typing import Mapping, TextIO, Callable
 
 import attr
 import click
-from ruamel import yaml
+import yaml
 from attr.validators import optional, instance_of
 
 from .. import rpm
 
+try:  # prefer the libyaml-backed implementation when available
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper, SafeLoader
+
+try:  # optional rapidyaml-backed report emission
+    import ryml
+except ImportError:  # pragma: no cover
+    ryml = None
+
 
 LOG = logging.getLogger(__name__)
 
+
 # Add YAML dump capabilities for python types not supported by default
-YAMLDumper = deepcopy(yaml.SafeDumper)
+class YAMLDumper(SafeDumper):
+    """SafeDumper extended with representers for additional python types."""
+
+
 YAMLDumper.add_representer(defaultdict, lambda r, d: r.represent_dict(d))
+YAMLDumper.add_representer(OrderedDict, lambda r, d: r.represent_dict(d))
+
+#: Pre-configured dump entry point shared by all report emission sites
+dump_yaml = partial(yaml.dump, Dumper=YAMLDumper, default_flow_style=False)
+
+
+@lru_cache(maxsize=None)
+def _render_nevra(metadata: rpm.Metadata) -> str:
+    """Cached NEVRA rendering — the metadata is frozen, so the result never changes."""
+
+    return str(metadata)
+
+
+def _emit_ryml(structure: Mapping, stream: Optional[TextIO] = None) -> Optional[str]:
+    """Emit a report structure with the rapidyaml arena emitter.
+
+    Keyword arguments:
+        structure: The ``{el: {collection: [nevra, …]}}`` mapping to emit.
+        stream: The file stream to write the result into.
+
+    Returns:
+        The emitted document, when no stream was provided.
+    """
+
+    tree = ryml.Tree()
+    root = tree.root_id()
+    tree.to_map(root)
+
+    # rapidyaml keeps views into the provided buffers;
+    # every scalar has to stay alive until the document is emitted.
+    scalars = []
+
+    def scalar(value) -> str:
+        scalars.append(str(value))
+        return scalars[-1]
+
+    for el, collection_map in sorted(structure.items()):
+        el_node = tree.append_child(root)
+        tree.to_map(el_node, scalar(el))
+
+        for collection, package_list in sorted(collection_map.items()):
+            collection_node = tree.append_child(el_node)
+            tree.to_seq(collection_node, scalar(collection))
+
+            for package in package_list:
+                package_node = tree.append_child(collection_node)
+                tree.to_val(package_node, scalar(package))
+
+    document = ryml.emit_yaml(tree)
+
+    if stream is None:
+        return document
+
+    stream.write(document)
 
 
 #
@@ -39,6 +107,13 @@ class SCL:
     el = attr.ib(validator=instance_of(int))
 
 
+@lru_cache(maxsize=None)
+def _intern_scl(collection: str, el: int) -> SCL:
+    """Shared SCL instances — only a handful of distinct values occur per run."""
+
+    return SCL(collection=collection, el=el)
+
+
 @attr.s(slots=True, frozen=True)
 class Package:
     """Metadata and context of processed package"""
@@ -59,6 +134,20 @@ class Package:
         default=None, validator=optional(instance_of(Mapping)), cmp=False
     )
 
+    def with_metadata(self, metadata) -> "Package":
+        """Copy of the package carrying new metadata.
+
+        Direct construction — unlike attr.evolve,
+        no field introspection is performed on this per-package path.
+        """
+
+        return Package(
+            scl=self.scl,
+            metadata=metadata,
+            source=self.source,
+            destination=self.destination,
+        )
+
 
 @attr.s(slots=True, frozen=True)
 class PackageStream:
@@ -80,19 +169,66 @@ class PackageStream:
 
         return cls(iterator)
 
+    def to_mapping(self) -> Mapping:
+        """Report structure of the stream as plain python objects.
+
+        Intended for structural comparisons and alternative emitters —
+        no YAML serialization is involved.
+
+        Returns:
+            ``{el: {collection: [nevra, …]}}`` mapping of the stream.
+        """
+
+        structure = defaultdict(lambda: defaultdict(list))
+
+        entries = sorted(
+            (pkg.scl.el, pkg.scl.collection, _render_nevra(pkg.metadata))
+            for pkg in self._container
+        )
+        for el, collection, nevra in entries:
+            structure[el][collection].append(nevra)
+
+        return structure
+
     def to_yaml(self, stream: Optional[TextIO] = None):
         """Serialize packages in the stream to YAML format.
 
+        The document is emitted one EL block at a time: the sorted
+        entry list still covers the whole stream, but the nested
+        ``{el: {collection: […]}}`` structure is only ever built
+        for a single EL version at once.
+
         Keyword arguments:
             stream: The file stream to write the result into.
+
+        Returns:
+            The serialized document, when no stream was provided.
         """
 
-        structure = defaultdict(lambda: defaultdict(list))
+        if stream is None:
+            with StringIO() as buffer:
+                self.to_yaml(buffer)
+                return buffer.getvalue()
 
-        for pkg in sorted(self._container):
-            structure[pkg.scl.el][pkg.scl.collection].append(str(pkg.metadata))
+        if ryml is not None:
+            return _emit_ryml(self.to_mapping(), stream)
 
-        return yaml.dump(structure, stream, Dumper=YAMLDumper)
+        # Single decorate-sort pass: native tuple/string comparisons
+        # instead of per-package rich comparisons, with every NEVRA
+        # rendered exactly once for the report.
+        entries = sorted(
+            (pkg.scl.el, pkg.scl.collection, _render_nevra(pkg.metadata))
+            for pkg in self._container
+        )
+
+        for el, entry_iter in groupby(entries, key=itemgetter(0)):
+            block = defaultdict(list)
+            for _el, collection, nevra in entry_iter:
+                block[collection].append(nevra)
+
+            dump_yaml({el: block}, stream)
+
+        return None
 
     @classmethod
     def from_yaml(cls, structure_or_stream: Union[Mapping, TextIO]):
@@ -112,12 +248,12 @@ class PackageStream:
         if isinstance(structure_or_stream, Mapping):
             structure = structure_or_stream
         else:
-            structure = yaml.safe_load(structure_or_stream)
+            structure = yaml.load(structure_or_stream, Loader=SafeLoader)
 
         return cls(
             Package(
                 metadata=rpm.Metadata.from_nevra(nevra),
-                scl=SCL(collection=collection, el=el),
+                scl=_intern_scl(collection, el),
             )
             for el, collection_map in structure.items()
             for collection, pkg_list in collection_map.items()
@@ -179,21 +315,29 @@ def stream_processor(command: Optional[Callable] = None, **option_kind) -> Calla
                 for key, kind in option_kind.items()
             }
 
-            return attr.evolve(package, **services)
+            return Package(
+                scl=package.scl,
+                metadata=package.metadata,
+                source=services.get("source", package.source),
+                destination=services.get("destination", package.destination),
+            )
 
         def format_labels(package: Package) -> Package:
             """Process all format strings."""
 
+            # Only these two fields are consumed by the format strings;
+            # an explicit literal avoids attrs reflection per label.
+            scl_map = {"collection": package.scl.collection, "el": package.scl.el}
+
             for group in filter(None, (package.source, package.destination)):
                 for key in group.keys() & {"tags", "targets", "tests"}:
-                    group[key] = [
-                        l.format_map(attr.asdict(package.scl)) for l in group[key]
-                    ]
+                    group[key] = [l.format_map(scl_map) for l in group[key]]
 
             return package
 
-        # This changes
-        @wraps(command)
+        # Note: no @wraps here — it would run its attribute copying
+        # on every command invocation, and nothing introspects
+        # the prepared processor.
         def processor(stream: Iterator[Package]) -> Iterator[Package]:
             """The prepared command.
 
@@ -241,7 +385,6 @@ def stream_generator(command: Callable = None, **option_kind):
         # Obtain the processor
         processor = stream_processor(command, **option_kind)(*args, **kwargs)
 
-        @wraps(command)
         def generator(stream: Iterator[Package]) -> Iterator[Package]:
             # Group the packages, discard metadata
             groupings = groupby(stream, attrgetter("scl"))
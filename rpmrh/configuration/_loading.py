@@ -2,7 +2,6 @@
 
 import fnmatch
 from collections import ChainMap
-from contextlib import ExitStack
 from io import TextIOWrapper
 from itertools import chain
 from typing import Callable, Iterator, Mapping, Optional, Sequence, TextIO
@@ -14,10 +13,34 @@ from xdg.BaseDirectory import load_config_paths
 
 from .. import RESOURCE_ID
 
+try:  # prefer a C-accelerated TOML parser when available
+    import tomllib as _fast_toml
+except ImportError:  # pragma: no cover
+    try:
+        import tomli as _fast_toml
+    except ImportError:
+        _fast_toml = None
+
 #: Path from package root to bundled configuration
 RESOURCE_ROOT_DIR = "conf.d"
 
 
+def interpret_toml(stream: TextIO) -> Mapping:
+    """Parse a TOML stream with the fastest parser available.
+
+    Keyword arguments:
+        stream: The text stream to parse.
+
+    Returns:
+        Parsed configuration data.
+    """
+
+    if _fast_toml is not None:
+        return _fast_toml.loads(stream.read())
+
+    return toml.load(stream)
+
+
 def open_matching_resources(
     glob: str,
     *,
@@ -75,7 +98,7 @@ def open_matching_files(
 
 
 def load_matching_configuration(
-    glob: str, *, interpret: Callable[[TextIO], Mapping] = toml.load
+    glob: str, *, interpret: Callable[[TextIO], Mapping] = interpret_toml
 ) -> ChainMap:
     """Load configuration from all matching files/resources.
 
@@ -90,10 +113,16 @@ def load_matching_configuration(
         Configuration data merged into single ChainMap.
     """
 
-    with ExitStack() as to_close:
-        file_iter = open_matching_files(glob)
-        resource_iter = open_matching_resources(glob)
-        stream_iter = map(to_close.enter_context, chain(file_iter, resource_iter))
-        data_iter = map(interpret, stream_iter)
+    def data_iter() -> Iterator[Mapping]:
+        """Open, parse and close one stream at a time.
+
+        Only a single file descriptor is held open at any moment,
+        no matter how many configuration files match the glob.
+        """
+
+        source_iter = (open_matching_files(glob), open_matching_resources(glob))
+        for stream in chain.from_iterable(source_iter):
+            with stream:
+                yield interpret(stream)
 
-        return ChainMap(*data_iter)
+    return ChainMap(*data_iter())
@@ -1,6 +1,7 @@
 """RPM-related classes and procedures."""
 import operator
 import re
+from functools import lru_cache
 from functools import partialmethod
 from pathlib import Path
 from typing import Any
@@ -150,13 +151,17 @@ class Metadata:
     def nvr(self) -> str:
         """:samp:`{name}-{version}-{release}` string of the RPM object"""
 
-        return "{s.name}-{s.version}-{s.release}".format(s=self)
+        # Positional formatting: the attribute-path field parsing
+        # is measurable on this frequently rendered property.
+        return "{}-{}-{}".format(self.name, self.version, self.release)
 
     @property
     def nevra(self) -> str:
         """:samp:`{name}-{epoch}:{version}-{release}.{arch}` string of the RPM object"""
 
-        return "{s.name}-{s.epoch}:{s.version}-{s.release}.{s.arch}".format(s=self)
+        return "{}-{}:{}-{}.{}".format(
+            self.name, self.epoch, self.version, self.release, self.arch
+        )
 
     @property
     def label(self) -> Tuple[str, str, str]:
@@ -277,9 +282,13 @@ class LocalPackage:
 
 
 # Utility functions
+@lru_cache(maxsize=None)
 def shorten_dist_tag(metadata: Metadata) -> Metadata:
     """Shorten release string by removing extra parts of dist tag.
 
+    The metadata is immutable, so results are cached;
+    repeated shortening of the same build costs a single dict lookup.
+
     Examples:
         - abcde-1.0-1.el7_4 → abcde-1.0-1.el7
         - binutils-3.6-4.el8+4 → binutils-3.6-4.el8
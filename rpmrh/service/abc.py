@@ -31,11 +31,15 @@ class Repository(metaclass=ABCMeta):
         """Set of tag prefixes associated with this Repository."""
 
     @abstractmethod
-    def latest_builds(self, tag_name: str) -> Iterator[rpm.Metadata]:
+    def latest_builds(
+        self, tag_name: str, *, package_prefix: Optional[str] = None
+    ) -> Iterator[rpm.Metadata]:
         """Provide metadata for all latest builds within a tag.
 
         Keyword arguments:
             tag_name: Name of the tag to query.
+            package_prefix: When provided, only builds of packages
+                with this name prefix are reported.
 
         Yields:
             Metadata for all latest builds within the tag.
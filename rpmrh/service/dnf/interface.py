@@ -26,6 +26,10 @@ else:
     DNFPackage = system_import("dnf.package", "Package")
 
 
+#: Names of the metadata attributes extracted from a DNF package
+_METADATA_ATTRIBUTES = frozenset(a.name for a in attr.fields(rpm.Metadata))
+
+
 def convert_metadata(package: DNFPackage) -> rpm.Metadata:
     """Convert DNFPackage to rpm.Metadata format.
 
@@ -42,9 +46,7 @@ def convert_metadata(package: DNFPackage) -> rpm.Metadata:
     # of toying with the Adapter pattern is probably for the best.
     # Attempts at a reasonable Adapter implementation welcome :)
 
-    attributes = {a.name for a in attr.fields(rpm.Metadata)}
-
-    return rpm.Metadata(**{a: getattr(package, a) for a in attributes})
+    return rpm.Metadata(**{a: getattr(package, a) for a in _METADATA_ATTRIBUTES})
 
 
 @service.register("dnf", initializer="configured")
@@ -88,11 +90,15 @@ class RepoGroup(abc.Repository):
 
         return self.base.repos.keys()
 
-    def latest_builds(self, tag_name: str) -> Iterator[rpm.Metadata]:
+    def latest_builds(
+        self, tag_name: str, *, package_prefix: Optional[str] = None
+    ) -> Iterator[rpm.Metadata]:
         """Provide metadata for all latest builds within a tag.
 
         Keyword arguments:
             tag_name: Name of the tag to query.
+            package_prefix: When provided, the results are narrowed
+                to packages with this name prefix by the sack query.
 
         Yields:
             Metadata for all latest builds within the tag.
@@ -103,6 +109,8 @@ class RepoGroup(abc.Repository):
         self.base.fill_sack(load_system_repo=False)
 
         query = self.base.sack.query()
+        if package_prefix is not None:
+            query = query.filter(name__glob=package_prefix + "*")
         yield from map(convert_metadata, query.latest())
 
     def download(
@@ -4,6 +4,7 @@ import os
 import time
 from datetime import datetime
 from datetime import timezone
+from functools import lru_cache
 from itertools import groupby
 from itertools import starmap
 from operator import attrgetter
@@ -35,6 +36,13 @@ else:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _field_names(metadata_type: type) -> frozenset:
+    """Names of all attrs fields defined on a metadata type."""
+
+    return frozenset(attribute.name for attribute in attr.fields(metadata_type))
+
+
 @attr.s(slots=True, frozen=True, cmp=False)
 class BuiltPackage(rpm.Metadata):
     """Data for a built RPM package presented by a Koji service.
@@ -61,7 +69,7 @@ class BuiltPackage(rpm.Metadata):
             New BuiltPackage instance.
         """
 
-        valid_keys = {attribute.name for attribute in attr.fields(cls)}
+        valid_keys = _field_names(cls)
         known_data = {
             key: value for key, value in raw_data.items() if key in valid_keys
         }
@@ -166,17 +174,21 @@ class Service(abc.Repository, abc.Builder):
 
     # Queries
 
-    def latest_builds(self, tag_name: str) -> Iterator[BuiltPackage]:
+    def latest_builds(
+        self, tag_name: str, *, package_prefix: Optional[str] = None
+    ) -> Iterator[BuiltPackage]:
         """List latest builds within a tag.
 
         Keyword arguments:
             tag_name: Name of the tag to query.
+            package_prefix: When provided, the filtering by package name
+                prefix is performed server-side.
 
         Yields:
             Metadata for the latest builds in the specified tag.
         """
 
-        build_list = self.session.listTagged(tag_name)
+        build_list = self.session.listTagged(tag_name, prefix=package_prefix)
         build_iter = map(BuiltPackage.from_mapping, build_list)
         build_groups = groupby(sorted(build_iter), key=attrgetter("name"))
         latest_iter = starmap(lambda _name, group: max(group), build_groups)
@@ -4,47 +4,60 @@ from collections import namedtuple
 
 import click
 import pytest
-from ruamel import yaml
+import yaml
 
 import rpmrh.cli.tooling as tooling
 from rpmrh import rpm
 
+try:  # use the libyaml implementation where available, as the CLI does
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader
 
-@pytest.fixture
+#: Stand-in for a configured service — defined once, not per fixture call
+Service = namedtuple("Service", ["identification"])
+
+#: Metadata of the tested packages — frozen, safe to share between tests
+TEST_METADATA = (
+    rpm.Metadata(name="test", version="2.1", release="3.el7"),
+    rpm.Metadata(name="abcde", version="1.0", release="1.el7"),
+    rpm.Metadata(name="abcde", version="2.0", release="1.el7"),
+)
+
+
+@pytest.fixture(scope="module")
 def package_stream():
     """Prepared package stream"""
 
-    metadata = [
-        rpm.Metadata(name="test", version="2.1", release="3.el7"),
-        rpm.Metadata(name="abcde", version="1.0", release="1.el7"),
-        rpm.Metadata(name="abcde", version="2.0", release="1.el7"),
-    ]
-
     return tooling.PackageStream(
         tooling.Package(scl=tooling.SCL(collection="test", el=7), metadata=m)
-        for m in metadata
+        for m in TEST_METADATA
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def yaml_structure(package_stream):
     """Expected YAML representation of package_stream"""
 
     structure = {}
 
-    for pkg in sorted(package_stream._container):
-        el_map = structure.setdefault(pkg.scl.el, {})
-        scl_list = el_map.setdefault(pkg.scl.collection, [])
-        scl_list.append(str(pkg.metadata))
+    # Same decorate-sort the emitter applies: native string ordering,
+    # no reliance on the rpm-level rich comparisons.
+    entries = sorted(
+        (pkg.scl.el, pkg.scl.collection, str(pkg.metadata))
+        for pkg in package_stream._container
+    )
+
+    for el, collection, nevra in entries:
+        structure.setdefault(el, {}).setdefault(collection, []).append(nevra)
 
     return structure
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def phase():
     """Filled test registry"""
 
-    Service = namedtuple("Service", ["identification"])
     return {"repo": {"service": Service("simple"), "tags": ["simple-tag"]}}
 
 
@@ -57,7 +70,7 @@ def make_command(function, phase):
     return decorator(function)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def process_command(phase):
     """Dummy click command for tests of stream processing"""
 
@@ -66,7 +79,7 @@ def process_command(phase):
     return make_command(processor, phase)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def generate_command(phase):
     """Dummy click command for tests of stream generation"""
 
@@ -91,38 +104,81 @@ def test_stream_consumption(package_stream):
     assert result == package_stream
 
 
+def test_stream_structure(package_stream, yaml_structure):
+    """The report structure matches without any YAML round-trip."""
+
+    assert package_stream.to_mapping() == yaml_structure
+
+
+def test_ryml_emission(yaml_structure):
+    """The rapidyaml emitter produces an equivalent document."""
+
+    pytest.importorskip("ryml")
+
+    result = yaml.load(tooling._emit_ryml(yaml_structure), Loader=SafeLoader)
+
+    assert result == yaml_structure
+
+
 def test_stream_serialization(package_stream, yaml_structure):
     """PackageStream can be serialized into YAML."""
 
-    result = yaml.safe_load(package_stream.to_yaml())
+    result = yaml.load(package_stream.to_yaml(), Loader=SafeLoader)
 
     assert result == yaml_structure
 
 
+@pytest.mark.parametrize(
+    "metadata", TEST_METADATA, ids=[m.nvr for m in TEST_METADATA]
+)
+def test_stream_reports_package(metadata, package_stream):
+    """Each package is reported under its collection and EL version."""
+
+    structure = yaml.load(package_stream.to_yaml(), Loader=SafeLoader)
+
+    assert str(metadata) in structure[7]["test"]
+
+
+@pytest.mark.benchmark(group="serialize")
+def test_stream_serialization_benchmark(benchmark):
+    """Serialization of a large stream stays within the expected budget."""
+
+    stream = tooling.PackageStream(
+        tooling.Package(
+            scl=tooling.SCL(collection="test", el=7),
+            metadata=rpm.Metadata(
+                name="pkg{}".format(i), version="1.0", release="1.el7"
+            ),
+        )
+        for i in range(10000)
+    )
+
+    document = benchmark(stream.to_yaml)
+
+    assert yaml.load(document, Loader=SafeLoader)
+
+
 def test_stream_deserialization(package_stream, yaml_structure):
     """PackageStream can be created from YAML representation."""
 
-    result = tooling.PackageStream.from_yaml(yaml.safe_dump(yaml_structure))
+    result = tooling.PackageStream.from_yaml(tooling.dump_yaml(yaml_structure))
 
     assert result is not package_stream
     assert result == package_stream
 
 
-def test_stream_expansion(process_command, package_stream):
-    """All packages in a stream are expanded as expected"""
+@pytest.mark.parametrize("index", range(len(TEST_METADATA)))
+def test_stream_expansion(index, process_command, package_stream):
+    """Each package in a stream is expanded as expected"""
 
-    # Manually apply the decorator
+    # Manually apply the decorator; iteration order is deterministic,
+    # so the index addresses a stable package.
     ctx = process_command.make_context("test_stream_expansion", [])
-    stream = ctx.invoke(process_command)(package_stream)
+    package = list(ctx.invoke(process_command)(package_stream))[index]
 
-    def valid_package(package):
-        valid_source = package.source["service"].identification == "simple"
-        valid_destination = package.destination is None
-        valid_metadata = package.metadata is not None
-
-        return all((valid_source, valid_destination, valid_metadata))
-
-    assert all(map(valid_package, stream))
+    assert package.source["service"].identification == "simple"
+    assert package.destination is None
+    assert package.metadata is not None
 
 
 def test_stream_generation(generate_command, package_stream):
@@ -12,6 +12,25 @@ from rpmrh import RESOURCE_ID
 from rpmrh.configuration import _loading as conf_loading
 
 
+#: Contents of a valid service configuration file — dedented once at import
+SERVICE_CONFIG = dedent(
+    """\
+    [test]
+    type = "dnf"
+    repo_configs = []
+    """
+)
+
+#: Contents of a valid phase configuration file — dedented once at import
+PHASE_CONFIG = dedent(
+    """\
+    [test.repo]
+    service = "test"
+    tags = []
+    """
+)
+
+
 @pytest.fixture
 def mock_package_resources(monkeypatch):
     """Prepared pkg_resources environment."""
@@ -95,20 +114,8 @@ def mock_config_files(mock_xdg_config_home, fs, monkeypatch):
     phase_path = path.join(mock_xdg_config_home, RESOURCE_ID, "test.phase.toml")
     content_map = {
         runtime_path: 'collection_list_url = "https://example.com/scl-{el}"',
-        service_path: dedent(
-            """\
-                [test]
-                type = "dnf"
-                repo_configs = []
-                """
-        ),
-        phase_path: dedent(
-            """\
-                [test.repo]
-                service = "test"
-                tags = []
-                """
-        ),
+        service_path: SERVICE_CONFIG,
+        phase_path: PHASE_CONFIG,
     }
 
     for pth, content in content_map.items():
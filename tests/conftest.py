@@ -33,37 +33,41 @@ with betamax.Betamax.configure() as config:
 # Fixtures
 
 
-@pytest.fixture(scope="module")
-def minimal_spec_contents():
-    """Text contents of a minimal SPEC file."""
+#: Text contents of a minimal SPEC file — dedented once at import
+MINIMAL_SPEC_CONTENTS = dedent(
+    """\
+    %{?scl:%scl_package test}
+    %{!?scl:%global pkg_name %{name}}
 
-    return dedent(
-        """\
-        %{?scl:%scl_package test}
-        %{!?scl:%global pkg_name %{name}}
+    Name:       %{?scl_prefix}test
+    Version:    1.0
+    Release:    1%{?dist}
+    Summary:    Minimal spec for testing purposes
 
-        Name:       %{?scl_prefix}test
-        Version:    1.0
-        Release:    1%{?dist}
-        Summary:    Minimal spec for testing purposes
+    Group:      Development/Testing
+    License:    MIT
+    URL:        http://test.example.com
 
-        Group:      Development/Testing
-        License:    MIT
-        URL:        http://test.example.com
+    %description
+    A minimal SPEC file for testing of RPM packaging.
 
-        %description
-        A minimal SPEC file for testing of RPM packaging.
+    %prep
+    %build
+    %install
+    %files
 
-        %prep
-        %build
-        %install
-        %files
+    %changelog
+    * Thu Jun 22 2017 Jan Stanek <jstanek@redhat.com> 1.0-1
+    - Initial package
+"""
+)
 
-        %changelog
-        * Thu Jun 22 2017 Jan Stanek <jstanek@redhat.com> 1.0-1
-        - Initial package
-    """
-    )
+
+@pytest.fixture(scope="module")
+def minimal_spec_contents():
+    """Text contents of a minimal SPEC file."""
+
+    return MINIMAL_SPEC_CONTENTS
 
 
 @pytest.fixture(scope="module")
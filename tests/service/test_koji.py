@@ -12,8 +12,8 @@ from textwrap import dedent
 import attr
 import koji as _koji
 import pytest
+import yaml
 from pytrie import StringTrie
-from ruamel import yaml
 
 from rpmrh import rpm
 from rpmrh.service import koji
@@ -158,12 +158,9 @@ class MockMutableRepo:
         return 42  # dummy task id
 
 
-@pytest.fixture
-def configuration_profile():
-    """Koji configuration profile"""
-
-    return dedent(
-        """\
+#: Koji configuration profile contents — dedented once at import
+CONFIGURATION_PROFILE = dedent(
+    """\
     [cbs]
 
     ;url of XMLRPC server
@@ -187,7 +184,14 @@ def configuration_profile():
     ;certificate of the CA that issued the HTTP server certificate
     serverca = /etc/pki/tls/certs/ca-bundle.trust.crt
     """
-    )
+)
+
+
+@pytest.fixture
+def configuration_profile():
+    """Koji configuration profile"""
+
+    return CONFIGURATION_PROFILE
 
 
 @pytest.fixture